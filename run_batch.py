@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Run many independent Tjostball simulations in parallel (no visualization).
+
+Each run gets its own seed and executes in a separate process, so batches
+scale with the number of CPU cores. This is the recommended way to do
+parameter sweeps and calibration; it composes with any speedups inside a
+single run.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from tjostball.models.game import TjostballModel
+
+
+def one_run(seed, n_steps=100, n_players_per_team=7):
+    """
+    Run a single headless simulation.
+
+    Args:
+        seed: Random seed for this run
+        n_steps: Number of simulation steps
+        n_players_per_team: Number of players per team
+
+    Returns:
+        DataFrame of collected model variables, tagged with the seed
+    """
+    model = TjostballModel(
+        n_players_per_team=n_players_per_team,
+        field_width=100,
+        field_height=70,
+        seed=seed
+    )
+    for _ in range(n_steps):
+        model.step()
+
+    data = model.get_dataframe()
+    data["Seed"] = seed
+    return data
+
+
+def batch_run(n_runs, n_steps=100, n_players_per_team=7, workers=None):
+    """
+    Run independent simulations in parallel and combine their data.
+
+    Args:
+        n_runs: Number of runs; run i uses seed i
+        n_steps: Number of simulation steps per run
+        n_players_per_team: Number of players per team
+        workers: Worker processes (default: CPU count)
+
+    Returns:
+        DataFrame of collected model variables for all runs, with a Seed column
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            one_run,
+            range(n_runs),
+            [n_steps] * n_runs,
+            [n_players_per_team] * n_runs,
+        ))
+
+    return pd.concat(results, ignore_index=True)
+
+
+def main():
+    """Run a batch of headless simulations across processes."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=8, help="Number of runs")
+    parser.add_argument("--steps", type=int, default=100, help="Steps per run")
+    parser.add_argument("--players", type=int, default=7, help="Players per team")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    print(f"Running {args.runs} Tjostball simulations "
+          f"({args.steps} steps each)...")
+
+    data = batch_run(args.runs, args.steps, args.players, args.workers)
+    final = data.groupby("Seed").last()
+
+    print("\nBatch complete!")
+    print(f"Collected {len(data)} data points from {args.runs} runs")
+    print(f"Team 0 total: {final['Score Team 0'].sum()}, "
+          f"Team 1 total: {final['Score Team 1'].sum()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,7 +35,7 @@ def main():
     print(f"Total game time: {model.game_time:.1f} seconds")
 
     # Get final data
-    data = model.datacollector.get_model_vars_dataframe()
+    data = model.get_dataframe()
     print(f"\nCollected {len(data)} data points")
 
 
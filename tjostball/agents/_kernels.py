@@ -0,0 +1,113 @@
+"""Numeric kernels for player perception and actions.
+
+These functions only take floats and NumPy arrays so they can be compiled
+with Numba. When Numba is not installed they run as plain Python.
+"""
+
+from math import hypot
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional (``tjostball[fast]``)
+    def njit(*args, **kwargs):
+        """Fallback decorator that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def nearest_by_team(d2_row, team, self_idx, self_team, vision2):
+    """
+    Find the nearest visible teammate and opponent.
+
+    Args:
+        d2_row: (N,) squared distances from the perceiving player
+        team: (N,) array of player teams
+        self_idx: Row of the perceiving player
+        self_team: Team of the perceiving player
+        vision2: Squared vision radius
+
+    Returns:
+        Tuple (nt_idx, no_idx, nt_d2, no_d2); indices are -1 if nobody is visible
+    """
+    nt_idx = -1
+    no_idx = -1
+    nt_d2 = vision2
+    no_d2 = vision2
+
+    for i in range(d2_row.shape[0]):
+        d2 = d2_row[i]
+
+        # Players at our exact position (including ourselves) are ignored
+        if i == self_idx or d2 == 0.0 or d2 > vision2:
+            continue
+
+        if team[i] == self_team:
+            if nt_idx < 0 or d2 < nt_d2:
+                nt_idx = i
+                nt_d2 = d2
+        elif no_idx < 0 or d2 < no_d2:
+            no_idx = i
+            no_d2 = d2
+
+    return nt_idx, no_idx, nt_d2, no_d2
+
+
+@njit(cache=True, fastmath=True)
+def any_within(pos_xy, self_idx, x, y, min_d2):
+    """
+    Check whether any other player is closer than sqrt(min_d2) to (x, y).
+
+    Args:
+        pos_xy: (N, 2) array of player positions
+        self_idx: Row of the moving player, which is skipped
+        x, y: Proposed position
+        min_d2: Squared minimum distance
+
+    Returns:
+        True if some other player is within range
+    """
+    for i in range(pos_xy.shape[0]):
+        if i == self_idx:
+            continue
+        dx = x - pos_xy[i, 0]
+        dy = y - pos_xy[i, 1]
+        if dx * dx + dy * dy < min_d2:
+            return True
+    return False
+
+
+@njit(cache=True, fastmath=True)
+def clamp_move(px, py, dx, dy, effective_speed, W, H):
+    """
+    Step from (px, py) along (dx, dy) and clamp to the field.
+
+    The step length is the player's effective speed, capped at the length
+    of (dx, dy) so players don't overshoot their target.
+
+    Returns:
+        Tuple (nx, ny) with the new position
+    """
+    dist = hypot(dx, dy)
+    if dist == 0.0:
+        return px, py
+
+    scale = min(effective_speed, dist) / dist
+
+    nx = min(max(px + dx * scale, 0.0), W)
+    ny = min(max(py + dy * scale, 0.0), H)
+    return nx, ny
+
+
+@njit(cache=True, fastmath=True)
+def pass_accuracy(base_accuracy, distance):
+    """Chance of a pass over ``distance`` reaching its target."""
+    distance_penalty = max(0.0, 1.0 - distance / 50.0)  # Penalty for long passes
+    return base_accuracy * distance_penalty
+
+
+@njit(cache=True, fastmath=True)
+def tackle_prob(attacker_skill, defender_skill):
+    """Chance of a tackle winning the ball from the ball carrier."""
+    return attacker_skill / (attacker_skill + defender_skill)
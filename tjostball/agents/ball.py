@@ -11,6 +11,9 @@ class Ball(Agent):
     Its position is updated by the model's physics system.
     """
 
+    # Agent type tag, so per-frame code can dispatch without isinstance
+    _kind = 0
+
     def __init__(self, model):
         """
         Initialize the ball agent.
@@ -19,10 +22,11 @@ class Ball(Agent):
             model: The model instance the agent belongs to
         """
         super().__init__(model)
-        self.is_ball = True  # Easy identifier for rendering
 
     def step(self):
         """
         Ball doesn't take actions - its position is controlled by model physics.
+
+        TjostballModel only steps its players, so this is never called there.
         """
         pass  # Ball has no agency
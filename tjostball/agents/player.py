@@ -1,15 +1,96 @@
 """Player agent implementation for Tjostball simulation."""
 
+from collections import deque
+from dataclasses import dataclass
+from math import atan2, cos, hypot, pi, sin, sqrt
+
+import numpy as np
 from mesa import Agent
-from enum import Enum
 
+from ._kernels import (
+    any_within, clamp_move, nearest_by_team, pass_accuracy, tackle_prob
+)
+
+
+# Finite State Machine states for player behavior. Plain ints keep the
+# per-step comparisons cheap and double as indices into the decision table.
+DEFENDING, ATTACKING, SUPPORTING, POSITIONING = range(4)
+
+
+# Event type codes stored in player memory as (event, success, target_id)
+EV_PASS, EV_KICK, EV_TACKLE = range(3)
+
+# Number of recent events each player remembers
+MEMORY_SIZE = 64
+
+
+class PlayerState:
+    """Namespace for the FSM state constants (kept for compatibility)."""
+    DEFENDING = DEFENDING
+    ATTACKING = ATTACKING
+    SUPPORTING = SUPPORTING
+    POSITIONING = POSITIONING
+
+
+# Attribute presets per role, in constructor order:
+# speed, strength, stamina, agility,
+# passing, catching, kicking, tackling,
+# decision_making, positioning, awareness
+_ROLE_BASES = {
+    # Physical - high strength, moderate speed; technical - excellent tackling
+    "front_fighter": np.array([4.5, 7.5, 95, 4.0,
+                               4.0, 5.0, 4.0, 8.0,
+                               5.0, 6.0, 5.0], dtype=np.float32),
+    # Physical - strong and fairly fast; technical - good kicking
+    "heavy_hitter": np.array([5.5, 7.0, 90, 5.0,
+                              5.0, 5.5, 7.5, 6.0,
+                              5.5, 5.5, 5.0], dtype=np.float32),
+    # Physical - very fast and agile; technical - good catching
+    "runner": np.array([8.0, 4.0, 85, 8.0,
+                        6.0, 7.5, 5.0, 4.0,
+                        6.5, 6.0, 7.0], dtype=np.float32),
+    # Balanced; mental - good awareness and positioning
+    "supporter": np.array([5.5, 5.5, 100, 5.5,
+                           6.0, 6.0, 5.5, 5.5,
+                           6.0, 7.0, 6.5], dtype=np.float32),
+}
+
+# Total random spread around each base value (stamina varies by +/-5)
+_ROLE_VARIATION = np.array([1.0, 1.0, 10.0, 1.0,
+                            1.0, 1.0, 1.0, 1.0,
+                            1.0, 1.0, 1.0], dtype=np.float32)
+
+
+@dataclass(slots=True)
+class Perception:
+    """
+    Snapshot of what a player perceives in a single step.
 
-class PlayerState(Enum):
-    """Finite State Machine states for player behavior."""
-    DEFENDING = "defending"
-    ATTACKING = "attacking"
-    SUPPORTING = "supporting"
-    POSITIONING = "positioning"
+    Attributes:
+        ball_pos: Ball position (x, y)
+        my_pos: Player's current position
+        has_ball: Whether this player has the ball
+        ball_holder: Which player has the ball (if any)
+        ball_distance: Distance to ball
+        ball_dx, ball_dy: Normalized direction to ball
+        goal_x, goal_y: Position of opponent's goal
+        own_goal_x, own_goal_y: Position of own goal
+        nearest_teammate: Closest visible teammate (or None)
+        nearest_opponent: Closest visible opponent (or None)
+    """
+    ball_pos: tuple
+    my_pos: tuple
+    has_ball: bool
+    ball_holder: object
+    ball_distance: float
+    ball_dx: float
+    ball_dy: float
+    goal_x: float
+    goal_y: float
+    own_goal_x: float
+    own_goal_y: float
+    nearest_teammate: object = None
+    nearest_opponent: object = None
 
 
 class TjostballPlayer(Agent):
@@ -18,13 +99,13 @@ class TjostballPlayer(Agent):
 
     Attributes:
         team: Team identifier (0 or 1)
-        state: Current FSM state
+        state: Current FSM state, stored in model.state_arr
         role: Player role (e.g., "runner", "fighter", etc.)
 
         Physical attributes:
             speed: Movement speed
             strength: Physical power for tackles and holding ball
-            stamina: Energy level (0-100)
+            stamina: Energy level (0-100), stored in model.stamina_arr
             agility: Maneuverability and dodge ability
 
         Technical attributes:
@@ -39,9 +120,13 @@ class TjostballPlayer(Agent):
             awareness: Perception of game state
 
         position: Current position on the field (handled by Mesa grid)
-        memory: List of recent events for decision making
+        memory: Recent (event, success, target_id) tuples, capped at MEMORY_SIZE
     """
 
+    # Agent type tag, so per-frame code can dispatch without isinstance
+    # (Ball._kind == 0)
+    _kind = 1
+
     def __init__(self, model, team, role=None,
                  speed=5.0, strength=5.0, stamina=100.0, agility=5.0,
                  passing=5.0, catching=5.0, kicking=5.0, tackling=5.0,
@@ -74,13 +159,12 @@ class TjostballPlayer(Agent):
         super().__init__(model)
         self.team = team
         self.role = role
-        self.state = PlayerState.POSITIONING
+        # FSM state starts at POSITIONING in the model's state array (see state)
 
         # Physical attributes
         self.speed = speed
         self.strength = strength
-        self.stamina = stamina
-        self.max_stamina = stamina
+        self.max_stamina = stamina  # Current stamina starts here (see stamina)
         self.agility = agility
 
         # Technical attributes
@@ -94,8 +178,38 @@ class TjostballPlayer(Agent):
         self.positioning = positioning
         self.awareness = awareness
 
+        # Derived skill values used every step; attributes don't change
+        # during a game, so compute them once
+        self._effective_speed = self.speed * (1 + self.agility / 20.0)  # Agility bonus
+        self._pass_base_acc = self.passing / 10.0  # 0-1 scale
+        self._kick_power = 2.0 + self.kicking / 5.0  # Higher skill = faster kick
+        self._kick_acc = self.kicking / 10.0  # 0-1 scale
+        self._tackle_offense = self.tackling + self.strength / 2
+        self._tackle_defense = self.strength + self.agility / 2
+
+        # Vision radius based on awareness: base 10, +2 per awareness point
+        self.vision_radius = 10 + self.awareness * 2
+
         # Memory for decision making (extensible)
-        self.memory = []
+        self.memory = deque(maxlen=MEMORY_SIZE)
+
+    @property
+    def stamina(self):
+        """Current stamina, kept in the model's stamina array."""
+        return self.model.stamina_arr[self._idx]
+
+    @stamina.setter
+    def stamina(self, value):
+        self.model.stamina_arr[self._idx] = value
+
+    @property
+    def state(self):
+        """Current FSM state, kept in the model's int8 state array."""
+        return int(self.model.state_arr[self._idx])
+
+    @state.setter
+    def state(self, value):
+        self.model.state_arr[self._idx] = value
 
     @classmethod
     def create_with_role(cls, model, team, role, random_generator=None):
@@ -112,105 +226,21 @@ class TjostballPlayer(Agent):
             model: The model instance
             team: Team identifier (0 or 1)
             role: Role name string
-            random_generator: Random number generator for variation
+            random_generator: NumPy Generator for variation (e.g. model.rng)
 
         Returns:
             TjostballPlayer instance with role-appropriate attributes
         """
-        import random as rand
-        rng = random_generator if random_generator else rand
-
-        # Base attributes with some random variation
-        def vary(base, variation=1.0):
-            return base + rng.random() * variation - variation / 2
-
-        if role == "front_fighter":
-            return cls(
-                model=model,
-                team=team,
-                role=role,
-                # Physical - high strength, moderate speed
-                speed=vary(4.5, 1.0),
-                strength=vary(7.5, 1.0),
-                stamina=vary(95, 10),
-                agility=vary(4.0, 1.0),
-                # Technical - excellent tackling
-                passing=vary(4.0, 1.0),
-                catching=vary(5.0, 1.0),
-                kicking=vary(4.0, 1.0),
-                tackling=vary(8.0, 1.0),
-                # Mental
-                decision_making=vary(5.0, 1.0),
-                positioning=vary(6.0, 1.0),
-                awareness=vary(5.0, 1.0)
-            )
-        elif role == "heavy_hitter":
-            return cls(
-                model=model,
-                team=team,
-                role=role,
-                # Physical - strong and fairly fast
-                speed=vary(5.5, 1.0),
-                strength=vary(7.0, 1.0),
-                stamina=vary(90, 10),
-                agility=vary(5.0, 1.0),
-                # Technical - good kicking
-                passing=vary(5.0, 1.0),
-                catching=vary(5.5, 1.0),
-                kicking=vary(7.5, 1.0),
-                tackling=vary(6.0, 1.0),
-                # Mental
-                decision_making=vary(5.5, 1.0),
-                positioning=vary(5.5, 1.0),
-                awareness=vary(5.0, 1.0)
-            )
-        elif role == "runner":
-            return cls(
-                model=model,
-                team=team,
-                role=role,
-                # Physical - very fast and agile
-                speed=vary(8.0, 1.0),
-                strength=vary(4.0, 1.0),
-                stamina=vary(85, 10),
-                agility=vary(8.0, 1.0),
-                # Technical - good catching
-                passing=vary(6.0, 1.0),
-                catching=vary(7.5, 1.0),
-                kicking=vary(5.0, 1.0),
-                tackling=vary(4.0, 1.0),
-                # Mental
-                decision_making=vary(6.5, 1.0),
-                positioning=vary(6.0, 1.0),
-                awareness=vary(7.0, 1.0)
-            )
-        elif role == "supporter":
-            return cls(
-                model=model,
-                team=team,
-                role=role,
-                # Physical - balanced
-                speed=vary(5.5, 1.0),
-                strength=vary(5.5, 1.0),
-                stamina=vary(100, 10),
-                agility=vary(5.5, 1.0),
-                # Technical - balanced
-                passing=vary(6.0, 1.0),
-                catching=vary(6.0, 1.0),
-                kicking=vary(5.5, 1.0),
-                tackling=vary(5.5, 1.0),
-                # Mental - good awareness and positioning
-                decision_making=vary(6.0, 1.0),
-                positioning=vary(7.0, 1.0),
-                awareness=vary(6.5, 1.0)
-            )
-        else:
+        base = _ROLE_BASES.get(role)
+        if base is None:
             # Default balanced player
-            return cls(
-                model=model,
-                team=team,
-                role=role
-            )
+            return cls(model=model, team=team, role=role)
+
+        rng = random_generator if random_generator is not None else np.random.default_rng()
+
+        # Base attributes with some random variation, drawn in one batch
+        values = base + (rng.random(base.size) - 0.5) * _ROLE_VARIATION
+        return cls(model, team, role, *values.tolist())
 
     def perceive(self):
         """
@@ -218,88 +248,71 @@ class TjostballPlayer(Agent):
         Returns detailed perception data including distances and game state.
 
         Returns:
-            Dictionary with:
-                - ball_pos: Ball position (x, y)
-                - ball_distance: Distance to ball
-                - ball_direction: Normalized direction to ball (dx, dy)
-                - my_pos: Player's current position
-                - has_ball: Whether this player has the ball
-                - ball_holder: Which player has the ball (if any)
-                - teammates: List of nearby teammates
-                - opponents: List of nearby opponents
-                - nearest_teammate: Closest teammate (or None)
-                - nearest_opponent: Closest opponent (or None)
-                - goal_pos: Position of opponent's goal
-                - own_goal_pos: Position of own goal
+            Perception with ball distance/direction, possession info,
+            goal positions and the nearest visible teammate/opponent
         """
-        perception = {
-            "ball_pos": self.model.ball_position,
-            "my_pos": self.pos,
-            "has_ball": self.model.ball_holder == self,
-            "ball_holder": self.model.ball_holder,
-            "teammates": [],
-            "opponents": [],
-            "nearest_teammate": None,
-            "nearest_opponent": None
-        }
+        ball_state = self.model.ball_state
+        ball_pos = (ball_state[0], ball_state[1])
+        ball_holder = self.model.ball_holder
 
         # Calculate ball distance and direction
-        if self.pos and self.model.ball_position:
-            bx, by = self.model.ball_position
+        ball_distance = float('inf')
+        ball_dx = ball_dy = 0
+        if self.pos and ball_pos:
+            bx, by = ball_pos
             mx, my = self.pos
             dx = bx - mx
             dy = by - my
-            distance = (dx**2 + dy**2)**0.5
+            ball_distance = hypot(dx, dy)
+            if ball_distance > 0:
+                inv_distance = 1.0 / ball_distance  # One division, two multiplies
+                ball_dx = dx * inv_distance
+                ball_dy = dy * inv_distance
+
+        goal_x, goal_y = self.model.goal_for_team[self.team]
+        own_goal_x, own_goal_y = self.model.own_goal_for_team[self.team]
+
+        perception = Perception(
+            ball_pos=ball_pos,
+            my_pos=self.pos,
+            has_ball=ball_holder is self,
+            ball_holder=ball_holder,
+            ball_distance=ball_distance,
+            ball_dx=ball_dx,
+            ball_dy=ball_dy,
+            goal_x=goal_x,
+            goal_y=goal_y,
+            own_goal_x=own_goal_x,
+            own_goal_y=own_goal_y,
+        )
 
-            perception["ball_distance"] = distance
-            if distance > 0:
-                perception["ball_direction"] = (dx / distance, dy / distance)
-            else:
-                perception["ball_direction"] = (0, 0)
-        else:
-            perception["ball_distance"] = float('inf')
-            perception["ball_direction"] = (0, 0)
-
-        # Goal positions (team 0 attacks right, team 1 attacks left)
-        if self.team == 0:
-            perception["goal_pos"] = (self.model.field_width, self.model.field_height / 2)
-            perception["own_goal_pos"] = (0, self.model.field_height / 2)
-        else:
-            perception["goal_pos"] = (0, self.model.field_height / 2)
-            perception["own_goal_pos"] = (self.model.field_width, self.model.field_height / 2)
-
-        # Get nearby agents (vision radius based on awareness)
-        vision_radius = 10 + self.awareness * 2  # Base 10, +2 per awareness point
         if self.pos:
-            neighbors = self.model.grid.get_neighbors(
-                self.pos,
-                radius=vision_radius,
-                include_center=False
+            perception.nearest_teammate, perception.nearest_opponent = (
+                self._nearest_players()
             )
 
-            min_teammate_dist = float('inf')
-            min_opponent_dist = float('inf')
-
-            for agent in neighbors:
-                if isinstance(agent, TjostballPlayer):
-                    # Calculate distance
-                    dx = agent.pos[0] - self.pos[0]
-                    dy = agent.pos[1] - self.pos[1]
-                    dist = (dx**2 + dy**2)**0.5
-
-                    if agent.team == self.team:
-                        perception["teammates"].append(agent)
-                        if dist < min_teammate_dist:
-                            min_teammate_dist = dist
-                            perception["nearest_teammate"] = agent
-                    else:
-                        perception["opponents"].append(agent)
-                        if dist < min_opponent_dist:
-                            min_opponent_dist = dist
-                            perception["nearest_opponent"] = agent
-
         return perception
 
+    def _nearest_players(self):
+        """
+        Find the nearest visible teammate and opponent.
+
+        Returns:
+            Tuple (nearest_teammate, nearest_opponent), each None if not visible
+        """
+        model = self.model
+        idx = self._idx
+        dx = model.px - model.px[idx]
+        dy = model.py - model.py[idx]
+
+        nt, no, _, _ = nearest_by_team(
+            dx * dx + dy * dy, model.team_arr, idx, self.team,
+            self.vision_radius ** 2
+        )
+        players = model.players
+        return (players[nt] if nt >= 0 else None,
+                players[no] if no >= 0 else None)
+
     def update_state(self, perception):
         """
         Update FSM state based on current perception.
@@ -310,31 +323,29 @@ class TjostballPlayer(Agent):
         - SUPPORTING: Team has ball but player doesn't have it
         - POSITIONING: Default state, no clear threat or opportunity
         """
-        ball_holder = perception["ball_holder"]
-        has_ball = perception["has_ball"]
-        ball_distance = perception["ball_distance"]
+        self.state = self._next_state(perception.ball_holder, perception.has_ball)
 
+    def _next_state(self, ball_holder, has_ball):
+        """Return the FSM state implied by who holds the ball."""
         if ball_holder:
             if ball_holder.team == self.team:
                 # Teammate has ball
                 if has_ball:
-                    self.state = PlayerState.ATTACKING
-                else:
-                    self.state = PlayerState.SUPPORTING
-            else:
-                # Opponent has ball
-                self.state = PlayerState.DEFENDING
-        else:
-            # Ball is loose - always try to attack it
-            # This ensures players actively pursue the ball
-            self.state = PlayerState.ATTACKING
+                    return ATTACKING
+                return SUPPORTING
+            # Opponent has ball
+            return DEFENDING
+
+        # Ball is loose - always try to attack it
+        # This ensures players actively pursue the ball
+        return ATTACKING
 
     def decide(self, perception):
         """
         Decide next action based on FSM state and perception.
 
         Args:
-            perception: Dictionary of perceived environment data
+            perception: Perception of the environment
 
         Returns:
             Action dictionary with type and parameters
@@ -342,93 +353,98 @@ class TjostballPlayer(Agent):
         # Update state based on perception
         self.update_state(perception)
 
-        # Decide action based on current state
-        if self.state == PlayerState.DEFENDING:
-            return self._decide_defending(perception)
-        elif self.state == PlayerState.ATTACKING:
-            return self._decide_attacking(perception)
-        elif self.state == PlayerState.SUPPORTING:
-            return self._decide_supporting(perception)
-        else:  # POSITIONING
-            return self._decide_positioning(perception)
-
-    def _decide_defending(self, perception):
+        # Unnormalized vector to the ball
+        distance = perception.ball_distance if self.pos else 0.0
+        return self._decide_for_state(
+            self.state, perception.ball_holder, perception.has_ball,
+            perception.ball_dx * distance, perception.ball_dy * distance,
+            perception.nearest_teammate, perception.goal_x, perception.goal_y
+        )
+
+    def _decide_for_state(self, state, ball_holder, has_ball, ball_dx, ball_dy,
+                          nearest_teammate, goal_x, goal_y):
+        """
+        Decide an action for the given FSM state.
+
+        All _decide_* helpers share this signature (minus ``state``) so the
+        caller can pass plain values without building an intermediate
+        perception object.
+
+        Args:
+            state: FSM state constant selecting the decision helper
+            ball_holder: Player holding the ball (or None)
+            has_ball: Whether this player has the ball
+            ball_dx, ball_dy: Vector from this player to the ball
+            nearest_teammate: Closest visible teammate (or None)
+            goal_x, goal_y: Position of opponent's goal
+        """
+        return self._DECIDERS[state](
+            self, ball_holder, has_ball, ball_dx, ball_dy,
+            nearest_teammate, goal_x, goal_y
+        )
+
+    def _decide_defending(self, ball_holder, has_ball, ball_dx, ball_dy,
+                          nearest_teammate, goal_x, goal_y):
         """Decide action when in DEFENDING state."""
-        ball_holder = perception["ball_holder"]
-        nearest_opponent = perception["nearest_opponent"]
+        if not self.pos:
+            return {"type": "idle"}
 
         # If opponent has ball and is close, try to tackle
         if ball_holder and ball_holder.team != self.team:
-            if self.pos:
-                dx = ball_holder.pos[0] - self.pos[0]
-                dy = ball_holder.pos[1] - self.pos[1]
-                distance = (dx**2 + dy**2)**0.5
-
-                if distance < 3.0:
-                    return {"type": "tackle", "target": ball_holder}
-                else:
-                    # Move toward ball carrier
-                    return {"type": "move", "direction": (dx, dy)}
+            dx = ball_holder.pos[0] - self.pos[0]
+            dy = ball_holder.pos[1] - self.pos[1]
+            if dx * dx + dy * dy < 9.0:  # Within 3 units
+                return {"type": "tackle", "target": ball_holder}
+            # Move toward ball carrier
+            return {"type": "move", "direction": (dx, dy)}
 
         # Otherwise, move to intercept ball
-        if perception["ball_pos"] and self.pos:
-            dx, dy = perception["ball_direction"]
-            return {"type": "move", "direction": (dx * perception["ball_distance"],
-                                                  dy * perception["ball_distance"])}
-
-        return {"type": "idle"}
+        return {"type": "move", "direction": (ball_dx, ball_dy)}
 
-    def _decide_attacking(self, perception):
+    def _decide_attacking(self, ball_holder, has_ball, ball_dx, ball_dy,
+                          nearest_teammate, goal_x, goal_y):
         """Decide action when in ATTACKING state."""
-        has_ball = perception["has_ball"]
-        goal_pos = perception["goal_pos"]
+        if not self.pos:
+            return {"type": "idle"}
 
-        if has_ball and self.pos:
-            # Player has the ball
-            gx, gy = goal_pos
-            mx, my = self.pos
-            goal_distance = ((gx - mx)**2 + (gy - my)**2)**0.5
-
-            # If close to goal, kick it
-            if goal_distance < 20:
-                return {"type": "kick", "target": goal_pos}
-
-            # If teammate is in better position, pass
-            nearest_teammate = perception["nearest_teammate"]
-            if nearest_teammate and nearest_teammate.pos:
-                tx, ty = nearest_teammate.pos
-                teammate_goal_dist = ((gx - tx)**2 + (gy - ty)**2)**0.5
-
-                # Pass if teammate is closer to goal and within range
-                if teammate_goal_dist < goal_distance - 10:
-                    teammate_dist = ((tx - mx)**2 + (ty - my)**2)**0.5
-                    if teammate_dist < 20:
-                        return {"type": "pass", "target": nearest_teammate}
-
-            # Otherwise, move toward goal
-            return {"type": "move", "direction": (gx - mx, gy - my)}
-        else:
+        if not has_ball:
             # Don't have ball, move toward it
-            if perception["ball_pos"] and self.pos:
-                dx, dy = perception["ball_direction"]
-                return {"type": "move", "direction": (dx * perception["ball_distance"],
-                                                      dy * perception["ball_distance"])}
-
-        return {"type": "idle"}
-
-    def _decide_supporting(self, perception):
+            return {"type": "move", "direction": (ball_dx, ball_dy)}
+
+        # Player has the ball
+        gx, gy = goal_x, goal_y
+        mx, my = self.pos
+        goal_d2 = (gx - mx)**2 + (gy - my)**2
+
+        # If close to goal (within 20 units), kick it
+        if goal_d2 < 400.0:
+            return {"type": "kick", "target": (gx, gy)}
+
+        # If teammate is in better position, pass
+        if nearest_teammate and nearest_teammate.pos:
+            tx, ty = nearest_teammate.pos
+            teammate_goal_d2 = (gx - tx)**2 + (gy - ty)**2
+
+            # Pass if teammate is 10+ units closer to goal and within 20 units
+            # (goal distance is at least 20 here, so the margin stays positive)
+            margin = sqrt(goal_d2) - 10
+            if teammate_goal_d2 < margin * margin:
+                if (tx - mx)**2 + (ty - my)**2 < 400.0:
+                    return {"type": "pass", "target": nearest_teammate}
+
+        # Otherwise, move toward goal
+        return {"type": "move", "direction": (gx - mx, gy - my)}
+
+    def _decide_supporting(self, ball_holder, has_ball, ball_dx, ball_dy,
+                           nearest_teammate, goal_x, goal_y):
         """Decide action when in SUPPORTING state."""
-        ball_holder = perception["ball_holder"]
-        goal_pos = perception["goal_pos"]
-
         if self.pos and ball_holder and ball_holder.pos:
             # Move to open space between ball carrier and goal
             bx, by = ball_holder.pos
-            gx, gy = goal_pos
 
             # Position ahead of ball carrier toward goal
-            target_x = bx + (gx - bx) * 0.4
-            target_y = by + (gy - by) * 0.4
+            target_x = bx + (goal_x - bx) * 0.4
+            target_y = by + (goal_y - by) * 0.4
 
             dx = target_x - self.pos[0]
             dy = target_y - self.pos[1]
@@ -437,16 +453,13 @@ class TjostballPlayer(Agent):
 
         return {"type": "idle"}
 
-    def _decide_positioning(self, perception):
+    def _decide_positioning(self, ball_holder, has_ball, ball_dx, ball_dy,
+                            nearest_teammate, goal_x, goal_y):
         """Decide action when in POSITIONING state."""
-        goal_pos = perception["goal_pos"]
-        own_goal_pos = perception["own_goal_pos"]
-
         if self.pos:
             # Move to defensive position between own goal and center field
-            ogx, ogy = own_goal_pos
-            center_x = self.model.field_width / 2
-            center_y = self.model.field_height / 2
+            ogx, ogy = self.model.own_goal_for_team[self.team]
+            center_x, center_y = self.model.field_center
 
             # Position at 2/3 between own goal and center
             target_x = ogx + (center_x - ogx) * 0.66
@@ -456,12 +469,19 @@ class TjostballPlayer(Agent):
             dy = target_y - self.pos[1]
 
             # Only move if far from target position
-            distance = (dx**2 + dy**2)**0.5
-            if distance > 5.0:
+            if dx * dx + dy * dy > 25.0:  # Farther than 5 units
                 return {"type": "move", "direction": (dx, dy)}
 
         return {"type": "idle"}
 
+    # Decision helper per FSM state, indexed by the state constants
+    _DECIDERS = (
+        _decide_defending,     # DEFENDING
+        _decide_attacking,     # ATTACKING
+        _decide_supporting,    # SUPPORTING
+        _decide_positioning,   # POSITIONING
+    )
+
     def would_collide(self, new_pos, min_distance=3.0):
         """
         Check if moving to new_pos would cause a collision with other players.
@@ -473,20 +493,11 @@ class TjostballPlayer(Agent):
         Returns:
             True if collision would occur, False otherwise
         """
-        new_x, new_y = new_pos
-
-        # Check all other players
-        for agent in self.model.agents:
-            if isinstance(agent, TjostballPlayer) and agent != self:
-                other_x, other_y = agent.pos
-                dx = new_x - other_x
-                dy = new_y - other_y
-                distance = (dx**2 + dy**2)**0.5
-
-                if distance < min_distance:
-                    return True
-
-        return False
+        # Positions in model._pos are kept current as players move
+        return any_within(
+            self.model._pos, self._idx, new_pos[0], new_pos[1],
+            min_distance * min_distance
+        )
 
     def execute_action(self, action):
         """
@@ -514,19 +525,12 @@ class TjostballPlayer(Agent):
 
         dx, dy = action["direction"]
 
-        # Normalize and scale by speed (modified by agility)
-        dist = (dx**2 + dy**2)**0.5
-        if dist > 0:
-            effective_speed = self.speed * (1 + self.agility / 20)  # Agility bonus
-            move_x = dx / dist * min(effective_speed, dist)
-            move_y = dy / dist * min(effective_speed, dist)
-
-            new_x = self.pos[0] + move_x
-            new_y = self.pos[1] + move_y
-
-            # Clamp to field boundaries
-            new_x = max(0, min(self.model.field_width, new_x))
-            new_y = max(0, min(self.model.field_height, new_y))
+        # Normalize and scale by speed (modified by agility), clamped to field
+        if dx or dy:
+            new_x, new_y = clamp_move(
+                self.pos[0], self.pos[1], dx, dy, self._effective_speed,
+                self.model.field_width, self.model.field_height
+            )
 
             # Only move if it won't cause a collision
             if not self.would_collide((new_x, new_y)):
@@ -534,7 +538,7 @@ class TjostballPlayer(Agent):
 
     def _execute_pass(self, action):
         """Execute a pass action."""
-        if not self.pos or self.model.ball_holder != self:
+        if not self.pos or self.model.ball_holder is not self:
             return
 
         target = action["target"]
@@ -544,34 +548,31 @@ class TjostballPlayer(Agent):
         # Calculate distance to target
         dx = target.pos[0] - self.pos[0]
         dy = target.pos[1] - self.pos[1]
-        distance = (dx**2 + dy**2)**0.5
+        distance = hypot(dx, dy)
 
         # Pass accuracy based on passing skill and distance
-        base_accuracy = self.passing / 10.0  # 0-1 scale
-        distance_penalty = max(0, 1 - distance / 50.0)  # Penalty for long passes
-        success_chance = base_accuracy * distance_penalty
+        success_chance = pass_accuracy(self._pass_base_acc, distance)
 
         # Add randomness
-        if self.model.random.random() < success_chance:
+        if self.model.draw() < success_chance:
             # Successful pass
             self.model.ball_holder = None
             # Set ball velocity toward target
             speed_factor = 3.0
-            self.model.ball_velocity = (dx / distance * speed_factor,
-                                       dy / distance * speed_factor)
+            scale = speed_factor / distance  # Normalize and scale in one step
+            self.model.ball_velocity = (dx * scale, dy * scale)
             # Store event in memory
-            self.memory.append({"type": "pass", "success": True, "target": target})
+            self.memory.append((EV_PASS, 1, target.unique_id))
         else:
             # Failed pass - ball goes in random direction
             self.model.ball_holder = None
-            angle = self.model.random.random() * 6.28  # Random angle
-            import math
-            self.model.ball_velocity = (math.cos(angle) * 2.0, math.sin(angle) * 2.0)
-            self.memory.append({"type": "pass", "success": False})
+            angle = self.model.draw() * 2 * pi  # Random angle
+            self.model.ball_velocity = (cos(angle) * 2.0, sin(angle) * 2.0)
+            self.memory.append((EV_PASS, 0, target.unique_id))
 
     def _execute_kick(self, action):
         """Execute a kick action."""
-        if not self.pos or self.model.ball_holder != self:
+        if not self.pos or self.model.ball_holder is not self:
             return
 
         target_pos = action["target"]
@@ -581,27 +582,23 @@ class TjostballPlayer(Agent):
         # Calculate direction to target
         dx = target_pos[0] - self.pos[0]
         dy = target_pos[1] - self.pos[1]
-        distance = (dx**2 + dy**2)**0.5
-
-        if distance == 0:
+        if dx == 0 and dy == 0:
             return
 
         # Kick power and accuracy based on kicking skill
-        kick_power = 2.0 + self.kicking / 5.0  # Higher skill = faster kick
-        accuracy = self.kicking / 10.0  # 0-1 scale
+        kick_power = self._kick_power
 
         # Add inaccuracy based on skill
-        import math
-        angle_error = (self.model.random.random() - 0.5) * (1 - accuracy) * 0.5
-        base_angle = math.atan2(dy, dx)
+        angle_error = (self.model.draw() - 0.5) * (1 - self._kick_acc) * 0.5
+        base_angle = atan2(dy, dx)
         actual_angle = base_angle + angle_error
 
         # Release ball and set velocity
         self.model.ball_holder = None
-        self.model.ball_velocity = (math.cos(actual_angle) * kick_power,
-                                   math.sin(actual_angle) * kick_power)
+        self.model.ball_velocity = (cos(actual_angle) * kick_power,
+                                   sin(actual_angle) * kick_power)
 
-        self.memory.append({"type": "kick", "target": target_pos})
+        self.memory.append((EV_KICK, 1, -1))  # Kicks target a position
 
     def _execute_tackle(self, action):
         """Execute a tackle action."""
@@ -613,46 +610,60 @@ class TjostballPlayer(Agent):
             return
 
         # Check if target has the ball
-        if self.model.ball_holder != target:
+        if self.model.ball_holder is not target:
             return
 
         # Calculate distance
         dx = target.pos[0] - self.pos[0]
         dy = target.pos[1] - self.pos[1]
-        distance = (dx**2 + dy**2)**0.5
-
-        # Must be very close to tackle
-        if distance > 3.0:
+        # Must be very close to tackle (within 3 units)
+        if dx * dx + dy * dy > 9.0:
             return
 
         # Tackle success based on tackling skill vs target's strength
-        attacker_skill = self.tackling + self.strength / 2
-        defender_skill = target.strength + target.agility / 2
+        success_chance = tackle_prob(self._tackle_offense, target._tackle_defense)
 
-        success_chance = attacker_skill / (attacker_skill + defender_skill)
-
-        if self.model.random.random() < success_chance:
+        if self.model.draw() < success_chance:
             # Successful tackle - steal the ball
             self.model.ball_holder = self
-            self.memory.append({"type": "tackle", "success": True, "target": target})
+            self.memory.append((EV_TACKLE, 1, target.unique_id))
         else:
             # Failed tackle - ball becomes loose
             self.model.ball_holder = None
             # Ball bounces away
-            import math
-            angle = self.model.random.random() * 6.28
-            self.model.ball_velocity = (math.cos(angle) * 1.5, math.sin(angle) * 1.5)
-            self.memory.append({"type": "tackle", "success": False})
+            angle = self.model.draw() * 2 * pi
+            self.model.ball_velocity = (cos(angle) * 1.5, sin(angle) * 1.5)
+            self.memory.append((EV_TACKLE, 0, target.unique_id))
 
     def step(self):
         """
         Agent step function - called each simulation step.
         Implements the perception-decision-action cycle.
         """
-        # Reduce stamina slightly each step
-        self.stamina = max(0, self.stamina - 0.1)
+        if not self.pos:
+            return
+
+        # Perception -> Decision -> Action cycle, computed inline without
+        # building a Perception object (see perceive()/decide() for the
+        # equivalent public API)
+        model = self.model
+        ball_holder = model.ball_holder
+        has_ball = ball_holder is self
+
+        mx, my = self.pos
+        ball_state = model.ball_state
+        bx, by = ball_state[0], ball_state[1]
+
+        goal_x, goal_y = model.goal_for_team[self.team]
+
+        # Only the ball carrier looks for a teammate to pass to
+        nearest_teammate = self._nearest_players()[0] if has_ball else None
+
+        state = self._next_state(ball_holder, has_ball)
+        model.state_arr[self._idx] = state
+        action = self._decide_for_state(
+            state, ball_holder, has_ball, bx - mx, by - my,
+            nearest_teammate, goal_x, goal_y
+        )
 
-        # Perception -> Decision -> Action cycle
-        perception = self.perceive()
-        action = self.decide(perception)
         self.execute_action(action)
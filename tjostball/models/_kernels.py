@@ -0,0 +1,149 @@
+"""Numeric kernels for ball physics and possession.
+
+Like the player kernels, these only take floats and NumPy arrays so they
+can be compiled with Numba, and run as plain Python without it.
+"""
+
+from functools import lru_cache
+
+from tjostball.agents._kernels import njit
+
+
+@njit(cache=True, fastmath=True)
+def step_ball(state, W, H):
+    """
+    Advance a loose ball by one step, updating ``state`` in place.
+
+    Applies friction, moves the ball, bounces it off the field edges with
+    some energy loss and stops it once it is moving very slowly.
+
+    Args:
+        state: (4,) float64 array [bx, by, vx, vy]
+        W, H: Field width and height
+    """
+    bx = state[0]
+    by = state[1]
+    vx = state[2]
+    vy = state[3]
+
+    # Apply friction (slow down)
+    friction = 0.95
+    vx *= friction
+    vy *= friction
+
+    # Update position
+    bx += vx
+    by += vy
+
+    # Bounce off boundaries without branching: a hit flips the velocity and
+    # keeps 80% of it (v * (1 - 1.8) == -0.8 v), then the position is clamped
+    hit_x = (bx <= 0.0) | (bx >= W)
+    hit_y = (by <= 0.0) | (by >= H)
+    vx *= 1.0 - 1.8 * hit_x
+    vy *= 1.0 - 1.8 * hit_y
+    bx = max(0.0, min(W, bx))
+    by = max(0.0, min(H, by))
+
+    # Stop ball if moving very slowly
+    if abs(vx) < 0.1 and abs(vy) < 0.1:
+        vx = 0.0
+        vy = 0.0
+
+    state[0] = bx
+    state[1] = by
+    state[2] = vx
+    state[3] = vy
+
+
+@njit(cache=True, fastmath=True)
+def nearest_player(px, py, bx, by, radius2, n):
+    """
+    Find the player closest to the ball within a radius.
+
+    Args:
+        px, py: (n,) arrays of player positions
+        bx, by: Ball position
+        radius2: Squared possession radius
+        n: Number of players to scan
+
+    Returns:
+        Row of the closest player, or -1 if nobody is in range
+    """
+    best = -1
+    best_d2 = radius2
+    for i in range(n):
+        dx = px[i] - bx
+        dy = py[i] - by
+        d2 = dx * dx + dy * dy
+        if d2 < best_d2:
+            best = i
+            best_d2 = d2
+    return best
+
+
+@lru_cache(maxsize=None)
+def make_nearest_player(n):
+    """
+    Build a possession-scan kernel specialized for exactly ``n`` players.
+
+    ``n`` is a compile-time constant inside the returned function, so
+    Numba can unroll the scan for the usual team sizes. Kernels are
+    cached per ``n``, so every model with the same player count shares
+    one compiled function. The closure only captures the int ``n``, which
+    keeps it cacheable on disk across processes.
+
+    Args:
+        n: Number of players (rows of the position arrays)
+
+    Returns:
+        Kernel nearest_player_n(px, py, bx, by, radius2)
+    """
+    @njit(cache=True, fastmath=True)
+    def nearest_player_n(px, py, bx, by, radius2):
+        """nearest_player() over exactly ``n`` players."""
+        return nearest_player(px, py, bx, by, radius2, n)
+
+    return nearest_player_n
+
+
+@lru_cache(maxsize=None)
+def make_ball_step(n):
+    """
+    Build the fused per-step ball kernel for exactly ``n`` players.
+
+    One call does what update_ball_physics and check_ball_possession do
+    in turn: a held ball follows its holder, a loose ball moves under
+    step_ball and is then picked up by the nearest player in range.
+
+    Args:
+        n: Number of players (rows of the position arrays)
+
+    Returns:
+        Kernel ball_step(state, px, py, holder, hx, hy, W, H, radius2)
+    """
+    @njit(cache=True, fastmath=True)
+    def ball_step(state, px, py, holder, hx, hy, W, H, radius2):
+        """
+        Advance the ball by one step, updating ``state`` in place.
+
+        Args:
+            state: (4,) float64 array [bx, by, vx, vy]
+            px, py: (n,) arrays of player positions
+            holder: Row of the ball holder, or -1 if the ball is loose
+            hx, hy: Position of the holder (ignored for a loose ball)
+            W, H: Field width and height
+            radius2: Squared possession radius
+
+        Returns:
+            Row of the holder after the step (-1 if still loose)
+        """
+        if holder >= 0:
+            # Ball follows the holder
+            state[0] = hx
+            state[1] = hy
+            return holder
+
+        step_ball(state, W, H)
+        return nearest_player(px, py, state[0], state[1], radius2, n)
+
+    return ball_step
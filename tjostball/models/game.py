@@ -1,9 +1,16 @@
 """Game model implementation for Tjostball simulation."""
 
-from mesa import Model, DataCollector
-from mesa.space import ContinuousSpace
-from tjostball.agents.player import TjostballPlayer
+import numpy as np
+import pandas as pd
+from mesa import Model
+from tjostball.agents.player import POSITIONING, TjostballPlayer
 from tjostball.agents.ball import Ball
+from tjostball.space import FieldSpace
+from tjostball.models._kernels import make_ball_step, make_nearest_player, step_ball
+
+
+# Columns of the per-step statistics returned by get_dataframe()
+METRIC_COLUMNS = ("Score Team 0", "Score Team 1", "Game Time")
 
 
 class TjostballModel(Model):
@@ -31,42 +38,72 @@ class TjostballModel(Model):
             seed: Random seed for reproducibility
         """
         super().__init__(seed=seed)
+        # Mesa 3.0 seeds model.random but not model.rng
+        self.rng = np.random.default_rng(seed)
 
         self.field_width = field_width
         self.field_height = field_height
         self.n_players_per_team = n_players_per_team
 
-        # Create continuous space for smooth movement
-        self.grid = ContinuousSpace(
-            field_width,
-            field_height,
-            torus=False
-        )
+        # Goal each team attacks / defends, indexed by team
+        # (team 0 attacks right, team 1 attacks left)
+        self.field_center = (field_width / 2, field_height / 2)
+        self.goal_for_team = ((field_width, field_height / 2), (0, field_height / 2))
+        self.own_goal_for_team = self.goal_for_team[::-1]
 
-        # Ball state
-        self.ball_position = (field_width / 2, field_height / 2)
-        self.ball_velocity = (0.0, 0.0)
+        # Create continuous space for smooth movement, backed by the
+        # player position arrays
+        self.grid = FieldSpace(self, field_width, field_height)
+
+        # Ball state [bx, by, vx, vy], updated in place each step
+        # (ball_position and ball_velocity are views of it as tuples)
+        self.ball_state = np.array([*self.field_center, 0.0, 0.0], dtype=np.float64)
         self.ball_holder = None
 
         # Game state
         self.score = [0, 0]
         self.game_time = 0.0
 
-        # Create ball agent
+        # Create ball agent; players are kept in their own list so hot loops
+        # never need to filter the ball out of self.agents
         self.ball = Ball(self)
+        self.players = []
         self.grid.place_agent(self.ball, self.ball_position)
 
         # Create players for both teams
         self._create_teams()
 
-        # Data collector for tracking game statistics
-        self.datacollector = DataCollector(
-            model_reporters={
-                "Score Team 0": lambda m: m.score[0],
-                "Score Team 1": lambda m: m.score[1],
-                "Game Time": lambda m: m.game_time
-            }
-        )
+        # Struct-of-arrays player state shared with the player agents
+        self._init_player_arrays()
+
+        # Uniform random numbers for player actions, drawn from self.rng in
+        # batches (roughly 4 per player) and refilled when used up
+        self._rand_batch = 4 * len(self.players)
+        self._rand_buf = []
+        self._rand_idx = 0
+
+        # Game statistics, one row of METRIC_COLUMNS per step; rows are
+        # preallocated and the buffer doubles in size when it fills up
+        self._metrics = np.zeros((1024, len(METRIC_COLUMNS)), dtype=np.float64)
+        self._dc_i = 0
+
+    @property
+    def ball_position(self):
+        """Ball position as an (x, y) tuple (hot loops read ball_state)."""
+        return tuple(self.ball_state[:2].tolist())
+
+    @ball_position.setter
+    def ball_position(self, value):
+        self.ball_state[:2] = value
+
+    @property
+    def ball_velocity(self):
+        """Ball velocity as a (vx, vy) tuple."""
+        return tuple(self.ball_state[2:].tolist())
+
+    @ball_velocity.setter
+    def ball_velocity(self, value):
+        self.ball_state[2:] = value
 
     def _create_teams(self):
         """
@@ -100,71 +137,125 @@ class TjostballModel(Model):
                     model=self,
                     team=team,
                     role=role,
-                    random_generator=self.random
+                    random_generator=self.rng
                 )
 
                 self.grid.place_agent(player, (start_x, y_pos))
 
+                # Row of this player in the position/team arrays
+                player._idx = len(self.players)
+                self.players.append(player)
+
+    def _init_player_arrays(self):
+        """
+        Allocate the struct-of-arrays player state.
+
+        Row ``player._idx`` of each array belongs to one player:
+        - px, py: Position (views into the (N, 2) array ``_pos``)
+        - team_arr: Team identifier
+        - stamina_arr: Current stamina (``player.stamina`` reads this row)
+        - max_stamina_arr: Stamina each player started with
+        - state_arr: FSM state as an int8 (``player.state`` reads this row)
+
+        Positions and stamina are authoritative here: players write their row
+        when they move and stamina drains for everyone in one vectorized
+        update per step. Per-player floats are float32, which is plenty for
+        a 100x70 field and halves the memory the arrays take up.
+        """
+        players = self.players
+        n = len(players)
+
+        self._pos = np.array([player.pos for player in players], dtype=np.float32).reshape(n, 2)
+        self.px = self._pos[:, 0]
+        self.py = self._pos[:, 1]
+        self.team_arr = np.array([player.team for player in players], dtype=np.int8)
+        self.max_stamina_arr = np.array([player.max_stamina for player in players], dtype=np.float32)
+        self.stamina_arr = self.max_stamina_arr.copy()
+        self.state_arr = np.full(n, POSITIONING, dtype=np.int8)
+
+        # Per-player columns of the field view, overwritten in place each
+        # frame so drawing allocates no new arrays
+        self._view = {
+            "kind": np.full(n, TjostballPlayer._kind, dtype=np.int8),
+            "x": np.empty(n, dtype=np.float64),
+            "y": np.empty(n, dtype=np.float64),
+            "team": self.team_arr,
+            "size": np.empty(n, dtype=np.float64),
+            "holder": np.zeros(n, dtype=bool),
+        }
+
+        # Possession scan and fused ball update compiled for this number of
+        # players
+        self._nearest_player = make_nearest_player(n)
+        self._ball_step = make_ball_step(n)
+
+    def draw(self):
+        """
+        Return a uniform random float in [0, 1).
+
+        Numbers come from a pre-drawn batch of the model's NumPy generator,
+        so the per-call cost is a list lookup instead of an RNG call.
+        """
+        i = self._rand_idx
+        if i >= len(self._rand_buf):
+            self._rand_buf = self.rng.random(self._rand_batch).tolist()
+            i = 0
+        self._rand_idx = i + 1
+        return self._rand_buf[i]
+
     def update_ball_physics(self):
         """
         Update ball position based on velocity and apply friction.
         Simple physics model for the basic setup.
         """
+        state = self.ball_state
+
         if self.ball_holder is None:
             # Ball is loose - apply physics
-            vx, vy = self.ball_velocity
-            bx, by = self.ball_position
-
-            # Apply friction (slow down)
-            friction = 0.95
-            vx *= friction
-            vy *= friction
-
-            # Update position
-            new_x = bx + vx
-            new_y = by + vy
-
-            # Bounce off boundaries
-            if new_x <= 0 or new_x >= self.field_width:
-                vx = -vx * 0.8  # Energy loss on bounce
-                new_x = max(0, min(self.field_width, new_x))
-
-            if new_y <= 0 or new_y >= self.field_height:
-                vy = -vy * 0.8  # Energy loss on bounce
-                new_y = max(0, min(self.field_height, new_y))
-
-            self.ball_position = (new_x, new_y)
-            self.ball_velocity = (vx, vy)
-
-            # Stop ball if moving very slowly
-            if abs(vx) < 0.1 and abs(vy) < 0.1:
-                self.ball_velocity = (0.0, 0.0)
+            step_ball(state, self.field_width, self.field_height)
         else:
             # Ball follows the holder
-            self.ball_position = self.ball_holder.pos
+            state[0], state[1] = self.ball_holder.pos
 
         # Update ball agent position
-        self.grid.move_agent(self.ball, self.ball_position)
+        self.grid.move_agent(self.ball, (state[0], state[1]))
 
     def check_ball_possession(self):
         """Check if any player is close enough to possess the ball."""
         if self.ball_holder is None:
-            # Find closest player to ball
-            closest_player = None
-            min_distance = 2.0  # Possession radius
+            # Find closest player to ball (possession radius of 2 units)
+            state = self.ball_state
+            closest = self._nearest_player(self.px, self.py, state[0], state[1], 4.0)
 
-            for agent in self.agents:
-                if isinstance(agent, TjostballPlayer) and agent.pos:
-                    dx = agent.pos[0] - self.ball_position[0]
-                    dy = agent.pos[1] - self.ball_position[1]
-                    distance = (dx**2 + dy**2)**0.5
+            if closest >= 0:
+                self.ball_holder = self.players[closest]
 
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_player = agent
+    def advance_ball(self):
+        """
+        Move the ball and settle possession in a single kernel call.
 
-            if closest_player and min_distance < 2.0:
-                self.ball_holder = closest_player
+        Equivalent to update_ball_physics() followed by
+        check_ball_possession(), which remain available for calling one
+        phase on its own.
+        """
+        holder = self.ball_holder
+        if holder is None:
+            row, hx, hy = -1, 0.0, 0.0
+        else:
+            row = holder._idx
+            hx, hy = holder.pos
+
+        state = self.ball_state
+        new_row = self._ball_step(
+            state, self.px, self.py, row, hx, hy,
+            self.field_width, self.field_height, 4.0  # Possession radius 2, squared
+        )
+
+        # Update ball agent position
+        self.grid.move_agent(self.ball, (state[0], state[1]))
+
+        if new_row != row:
+            self.ball_holder = self.players[new_row]
 
     def step(self):
         """
@@ -173,15 +264,35 @@ class TjostballModel(Model):
         # Update game time
         self.game_time += 0.1
 
-        # Update ball physics
-        self.update_ball_physics()
+        # Update ball physics and check for ball possession
+        self.advance_ball()
 
-        # Check for ball possession
-        self.check_ball_possession()
+        # Stamina drains slightly each step for every player
+        self.stamina_arr -= np.float32(0.1)
+        np.maximum(self.stamina_arr, np.float32(0), out=self.stamina_arr)
 
-        # Advance all agents (Mesa 3.x uses built-in agent management)
-        for agent in self.agents:
-            agent.step()
+        # Advance the players; the ball is passive and moved by the physics
+        # above, so it is not stepped at all
+        for player in self.players:
+            player.step()
 
         # Collect data
-        self.datacollector.collect(self)
+        self._collect_metrics()
+
+    def _collect_metrics(self):
+        """Record this step's statistics in the next row of the buffer."""
+        i = self._dc_i
+        if i == len(self._metrics):
+            self._metrics = np.concatenate([self._metrics, np.zeros_like(self._metrics)])
+        self._metrics[i] = (self.score[0], self.score[1], self.game_time)
+        self._dc_i = i + 1
+
+    def get_dataframe(self):
+        """
+        Collected game statistics as a DataFrame.
+
+        Returns:
+            DataFrame with one row per step and METRIC_COLUMNS as columns
+        """
+        data = pd.DataFrame(self._metrics[:self._dc_i], columns=list(METRIC_COLUMNS))
+        return data.astype({"Score Team 0": int, "Score Team 1": int})
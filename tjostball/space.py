@@ -0,0 +1,52 @@
+"""Field space for Tjostball simulation."""
+
+from mesa.space import ContinuousSpace
+
+
+class FieldSpace(ContinuousSpace):
+    """
+    Rectangular, non-toroidal playing field.
+
+    Player positions live in the model's position arrays; this space keeps
+    them and ``agent.pos`` in sync. It is still a Mesa ContinuousSpace, so
+    Mesa's space drawing and neighbour helpers keep working.
+
+    The field edges belong to the field: a ball or player clamped to
+    exactly (width, height) is in bounds.
+    """
+
+    def __init__(self, model, width, height):
+        """
+        Initialize the field.
+
+        Args:
+            model: Model owning the position arrays (px, py)
+            width: Width of the playing field
+            height: Height of the playing field
+        """
+        super().__init__(width, height, torus=False)
+        self.model = model
+
+    def out_of_bounds(self, pos):
+        """Check if a point is outside the field (edges are inside)."""
+        x, y = pos
+        return x < self.x_min or x > self.x_max or y < self.y_min or y > self.y_max
+
+    def move_agent(self, agent, pos):
+        """
+        Move an agent, skipping Mesa's bounds check and index lookups.
+
+        Callers keep positions on the field (see clamp_move). Players also
+        have their row of the model's position arrays updated.
+
+        Args:
+            agent: Agent to move
+            pos: New (x, y) position
+        """
+        agent.pos = pos
+        idx = getattr(agent, "_idx", None)
+        if idx is not None:
+            self.model._pos[idx] = pos
+
+        # Mesa rebuilds its point cache from agent.pos if it is needed again
+        self._agent_points = None
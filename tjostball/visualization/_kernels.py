@@ -0,0 +1,26 @@
+"""Numeric kernels for drawing the field.
+
+Like the simulation kernels, these only take numbers and NumPy arrays so
+they can be compiled with Numba, and run as plain Python without it.
+"""
+
+from tjostball.agents._kernels import njit
+
+
+@njit(cache=True, fastmath=True)
+def compute_sizes(stamina, max_stamina, holder_idx, out_size):
+    """
+    Marker size per player from stamina, with the ball holder enlarged.
+
+    Sizes run from 50 (no stamina left) to 150 (full stamina); the ball
+    holder's marker is 30% larger.
+
+    Args:
+        stamina: (N,) current stamina per player
+        max_stamina: (N,) starting stamina per player
+        holder_idx: Row of the ball holder, or -1 if the ball is loose
+        out_size: (N,) float64 array the sizes are written into
+    """
+    for i in range(stamina.shape[0]):
+        size = 50.0 + (stamina[i] / max_stamina[i]) * 100.0
+        out_size[i] = size * 1.3 if i == holder_idx else size
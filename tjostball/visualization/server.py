@@ -1,56 +1,100 @@
 """Visualization server for Tjostball simulation using Mesa 3.x Solara interface."""
 
-from mesa.visualization import SolaraViz, Slider, make_space_component
-from tjostball.models.game import TjostballModel
-from tjostball.agents.player import TjostballPlayer
+from functools import lru_cache
+
+import altair as alt
+import numpy as np
+import solara
+from mesa.visualization import SolaraViz, Slider
+from mesa.visualization.utils import update_counter
 from tjostball.agents.ball import Ball
+from tjostball.agents.player import TjostballPlayer
+from tjostball.models.game import TjostballModel
+from tjostball.visualization._kernels import compute_sizes
+
+
+# Team colors (matplotlib's tab:blue / tab:red), indexed by team; the
+# matplotlib names are used by agent_portrayal, the hex values by Vega
+PORTRAYAL_TEAM_COLORS = ("tab:blue", "tab:red")
+TEAM_COLORS = ("#1f77b4", "#d62728")
+
+# Altair encodings of the field view, built once at import. The axis
+# domains refer to the Vega params fw/fh (the field size), which each
+# chart using them defines with field_params()
+_FIELD_X = alt.X("x:Q", scale=alt.Scale(domain=[0, alt.ExprRef("fw")]), title=None)
+_FIELD_Y = alt.Y("y:Q", scale=alt.Scale(domain=[0, alt.ExprRef("fh")]), title=None)
+_TEAM_COLOR = alt.Color(
+    "team:N", scale=alt.Scale(domain=[0, 1], range=list(TEAM_COLORS)), legend=None
+)
+_PLAYER_SIZE = alt.Size("size:Q", scale=None)
+_HOLDER_STROKE = alt.condition("datum.holder", alt.value("lime"), _TEAM_COLOR)
+_HOLDER_STROKE_WIDTH = alt.condition("datum.holder", alt.value(4), alt.value(1))
+
+
+def _portray_ball(agent):
+    """Portrayal of the ball."""
+    return {
+        "color": "yellow",
+        "size": 200,
+        "edgecolors": "orange",
+        "linewidths": 2,
+    }
+
+
+def _portray_player(agent):
+    """Portrayal of a player: team color, stamina size, ball-holder highlight."""
+    # Team color, looked up by team rather than branched on
+    color = PORTRAYAL_TEAM_COLORS[agent.team]
+
+    # Size based on stamina (larger = more stamina)
+    stamina_ratio = agent.stamina / agent.max_stamina
+    base_size = 50 + (stamina_ratio * 100)  # Size between 50-150
+
+    # Highlight player with ball possession
+    if agent.model.ball_holder is agent:
+        # Ball holder: larger size and bright lime border to stand out
+        size = base_size * 1.3  # 30% larger
+        edgecolor = "lime"
+        linewidth = 4
+    else:
+        # Regular players: subtle team-colored border
+        size = base_size
+        edgecolor = color
+        linewidth = 1
+
+    return {
+        "color": color,
+        "size": size,
+        "edgecolors": edgecolor,
+        "linewidths": linewidth,
+    }
+
+
+# Portrayal function per agent type tag (Ball._kind, TjostballPlayer._kind)
+_PORTRAYAL_DISPATCH = (_portray_ball, _portray_player)
 
 
 def agent_portrayal(agent):
     """
     Portrayal function for agents in the visualization.
 
-    Returns a dictionary with agent visual properties for rendering.
+    Returns a dictionary with agent visual properties for rendering. The
+    page draws the field with FieldView instead; this stays for use with
+    Mesa's ``make_space_component(agent_portrayal)``.
     """
-    # Ball
-    if isinstance(agent, Ball):
-        return {
-            "color": "yellow",
-            "size": 200,
-            "edgecolors": "orange",
-            "linewidths": 2,
-        }
-
-    # Players
-    if isinstance(agent, TjostballPlayer):
-        # Team color
-        color = "tab:blue" if agent.team == 0 else "tab:red"
-
-        # Size based on stamina (larger = more stamina)
-        stamina_ratio = agent.stamina / agent.max_stamina
-        base_size = 50 + (stamina_ratio * 100)  # Size between 50-150
-
-        # Highlight player with ball possession
-        if agent.model.ball_holder == agent:
-            # Ball holder: larger size and bright lime border to stand out
-            size = base_size * 1.3  # 30% larger
-            edgecolor = "lime"
-            linewidth = 4
-        else:
-            # Regular players: subtle team-colored border
-            size = base_size
-            edgecolor = color
-            linewidth = 1
-
-        return {
-            "color": color,
-            "size": size,
-            "edgecolors": edgecolor,
-            "linewidths": linewidth,
-        }
-
-    # Unknown agent type
-    return {}
+    kind = getattr(agent, "_kind", None)
+    if kind is None:
+        # Unknown agent type
+        return {}
+    return _PORTRAYAL_DISPATCH[kind](agent)
+
+
+def field_params(field_width, field_height):
+    """Vega params ``fw`` and ``fh`` holding the field size."""
+    return (
+        alt.param(name="fw", value=field_width),
+        alt.param(name="fh", value=field_height),
+    )
 
 
 def draw_ball(model):
@@ -58,29 +102,144 @@ def draw_ball(model):
     Custom drawing function to add the ball to the visualization.
     Returns Altair chart layer for the ball.
     """
-    import altair as alt
-    import pandas as pd
-
-    # Create a dataframe with the ball position
-    ball_df = pd.DataFrame([{
-        "x": model.ball_position[0],
-        "y": model.ball_position[1],
-    }])
+    # Inline the ball position; a one-row DataFrame is far more work
+    # than the two floats it would carry
+    bx, by = model.ball_position
+    ball_data = alt.Data(values=[{"x": float(bx), "y": float(by)}])
 
     # Create Altair chart for the ball
-    ball_chart = alt.Chart(ball_df).mark_circle(
+    ball_chart = alt.Chart(ball_data).mark_circle(
         size=200,
         color="yellow",
         stroke="orange",
         strokeWidth=2
     ).encode(
-        x=alt.X("x:Q", scale=alt.Scale(domain=[0, model.field_width])),
-        y=alt.Y("y:Q", scale=alt.Scale(domain=[0, model.field_height])),
-    )
+        x=_FIELD_X,
+        y=_FIELD_Y,
+    ).add_params(*field_params(model.field_width, model.field_height))
 
     return ball_chart
 
 
+@lru_cache(maxsize=None)
+def _field_template(field_width, field_height):
+    """
+    Vega-Lite spec of the field view without its data, built once per size.
+
+    All layers read the one named dataset "field", which field_spec()
+    fills in for each frame; each layer filters its rows by their ``kind``
+    (the agents' type tag), so Vega keeps a single data source for the
+    view. Everything else in the chart is fixed for a model, so Altair
+    only builds and validates it once.
+
+    The field size is set once as the Vega params ``fw`` and ``fh``; the
+    axis scales refer to those params instead of repeating the numbers.
+
+    Returns:
+        Vega-Lite spec dict (shared; copy before modifying)
+    """
+    players = alt.Chart().transform_filter(
+        f"datum.kind == {TjostballPlayer._kind}"
+    ).mark_circle(opacity=1).encode(
+        x=_FIELD_X,
+        y=_FIELD_Y,
+        size=_PLAYER_SIZE,
+        color=_TEAM_COLOR,
+        stroke=_HOLDER_STROKE,
+        strokeWidth=_HOLDER_STROKE_WIDTH,
+    )
+
+    ball = alt.Chart().transform_filter(
+        f"datum.kind == {Ball._kind}"
+    ).mark_circle(
+        size=200,
+        color="yellow",
+        stroke="orange",
+        strokeWidth=2,
+        opacity=1,
+    ).encode(x=_FIELD_X, y=_FIELD_Y)
+
+    chart = alt.layer(players, ball, data=alt.NamedData("field")).add_params(
+        *field_params(field_width, field_height)
+    )
+    return chart.properties(width=500, height=350).to_dict()
+
+
+def field_data(model):
+    """
+    Build the per-frame dataset straight from the model's player arrays.
+
+    Sizes, colors and the ball-holder highlight are computed as whole
+    arrays into the model's preallocated view buffers, so drawing a frame
+    makes no per-agent Python calls and allocates no new arrays.
+
+    Args:
+        model: TjostballModel to draw
+
+    Returns:
+        Dict with the "field" row list for the field template: one row per
+        player followed by the ball's row
+    """
+    view = model._view
+    holder_idx = -1 if model.ball_holder is None else model.ball_holder._idx
+
+    # Size based on stamina (larger = more stamina), 30% larger for the
+    # player with ball possession, who also gets a lime border
+    size = view["size"]
+    compute_sizes(model.stamina_arr, model.max_stamina_arr, holder_idx, size)
+    holder = view["holder"]
+    holder[:] = False
+    if holder_idx >= 0:
+        holder[holder_idx] = True
+
+    # The chart reaches the browser as JSON, where float32 values expand to
+    # ~17 digits each; positions and sizes are rounded to what the field
+    # view can show, which cuts the data payload by about a third
+    for column, values in (("x", model.px), ("y", model.py)):
+        np.copyto(view[column], values)
+        view[column].round(2, out=view[column])
+    size.round(1, out=size)
+
+    # Rows are zipped from the columns as Python lists; going through a
+    # DataFrame's to_dict("records") is about 25x slower for the same rows
+    names = tuple(view)
+    columns = [view[name].tolist() for name in names]
+    rows = [dict(zip(names, row)) for row in zip(*columns)]
+    bx, by = model.ball_position
+    rows.append({"kind": Ball._kind, "x": round(bx, 2), "y": round(by, 2)})
+    return {"field": rows}
+
+
+def field_spec(model):
+    """
+    Vega-Lite spec of the field for the model's current state.
+
+    Only the datasets are new each frame; the rest is the cached template.
+
+    Args:
+        model: TjostballModel to draw
+
+    Returns:
+        Vega-Lite spec dict
+    """
+    template = _field_template(model.field_width, model.field_height)
+    return {**template, "datasets": field_data(model)}
+
+
+@solara.component
+def FieldView(model):
+    """
+    Solara component drawing the field, redrawn after every step.
+
+    The spec is memoized on the model and its step count, so re-renders
+    that don't follow a step (UI interactions, a paused simulation)
+    reuse the last spec instead of rebuilding it.
+    """
+    update_counter.get()
+    spec = solara.use_memo(lambda: field_spec(model), dependencies=[model, model.steps])
+    return solara.widgets.VegaLite.element(spec=spec)
+
+
 # Model parameters that can be adjusted in the UI
 model_params = {
     "n_players_per_team": Slider(
@@ -97,17 +256,10 @@ model_params = {
 # Create an initial model instance
 model = TjostballModel()
 
-# Create space visualization component with matplotlib backend
-# Configure to not draw property layers (which don't exist for ContinuousSpace)
-space_component = make_space_component(
-    agent_portrayal,
-    propertylayer_portrayal=None,  # Disable property layers for ContinuousSpace
-)
-
-# Create the visualization page
+# Create the visualization page; the field is drawn from the model arrays
 page = SolaraViz(
     model,
-    components=[space_component],
+    components=[FieldView],
     model_params=model_params,
     name="Tjostball Simulation",
 )